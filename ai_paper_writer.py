@@ -26,10 +26,42 @@ algorithmic quirks or temporary spikes.
 """
 
 from __future__ import annotations
-import os, sys, textwrap, requests
+import os, sys, textwrap
+import bisect, hashlib, heapq, json, operator, re, time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, date
-from dotenv import load_dotenv
-from openai import OpenAI
+from pathlib import Path
+
+# requests, dotenv and openai are imported lazily at their point of use:
+# together they add a few hundred milliseconds of import time that cached
+# runs (and --help-style invocations) never need to pay.
+
+# Optional NumPy acceleration - when available, batch scoring runs as a
+# handful of vectorized array operations instead of a per-paper Python
+# loop. The pure-Python path below remains the fallback.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Optional fast JSON decoder - orjson is a Rust parser 2-5x faster than
+# the stdlib and matters more if per_page is ever raised. Stdlib json
+# remains the fallback.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Optional fast ISO-8601 parser - ciso8601 is a C extension that parses
+# dates 10x+ faster than datetime.fromisoformat. Fall back to stdlib if
+# it's not installed; the pipeline works identically either way.
+try:
+    import ciso8601
+    _parse_iso = ciso8601.parse_datetime
+except ImportError:
+    _parse_iso = datetime.fromisoformat
 
 # Configuration - adjust these to modify behavior
 TRENDING_ENDPOINT = "https://paperswithcode.com/api/v1/papers/?order=trending&per_page=25"
@@ -38,6 +70,166 @@ MODEL_NAME = "gpt-4o-mini"  # Use "gpt-4o" for higher quality (costs more)
 WORDS_LIMIT = 250
 CURRENT_YEAR = 2025  # Only papers from this year forward are considered
 
+# Top-tier venues that earn the conference bonus in scoring. Matching
+# uses a single case-insensitive alternation compiled once at import:
+# one regex scan of the venue string, with no .upper() copy and no
+# per-paper tokenization.
+PRESTIGIOUS_CONFERENCES = frozenset({
+    'ICLR', 'ICML', 'NEURIPS', 'AAAI', 'IJCAI', 'ACL', 'EMNLP'
+})
+_CONF_RE = re.compile(
+    r'\b(' + '|'.join(sorted(PRESTIGIOUS_CONFERENCES)) + r')\b', re.IGNORECASE
+)
+
+# Upper bound on what validate_external_trending can add to a paper
+# (ArXiv 10 + code 15 + conference 5). pick_best relies on this to
+# decide how far beyond the top-5 its validation shortlist must reach.
+_VALIDATION_MAX = 30
+
+# Recency bonus tiers: a paper `days_old` days old scores
+# _RECENCY_POINTS[bisect_left(_RECENCY_BUCKETS, days_old)]. One sorted
+# threshold lookup replaces the if/elif comparison chain, and the same
+# tables drive np.searchsorted in the vectorized scoring path.
+_RECENCY_BUCKETS = (7, 30, 90)
+_RECENCY_POINTS = (50, 25, 10, 0)
+
+# The only API fields the pipeline reads. Papers-with-Code has no
+# server-side field selection, so trim each record to these right after
+# decoding - the rest of the payload would otherwise be kept alive for
+# the whole run by the enrichment step.
+USED_FIELDS = ('title', 'url_abs', 'published', 'github_stars', 'conference')
+
+# Shared HTTP session - keeps connections alive across requests (saving
+# a TCP+TLS handshake per call once more endpoints are queried) and
+# retries transient failures/rate limits with exponential backoff.
+# Built lazily so importing this module doesn't pay for requests/urllib3.
+_SESSION = None
+
+def _session():
+    """Return the shared requests.Session, creating it on first use."""
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        _SESSION = requests.Session()
+        _SESSION.headers.update(HEADERS)
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+            ),
+        )
+        _SESSION.mount("https://", adapter)
+        _SESSION.mount("http://", adapter)
+    return _SESSION
+
+# Shared OpenAI client - the constructor sets up an httpx connection
+# pool, so reusing one instance lets consecutive chat() calls keep their
+# TLS connection alive instead of re-handshaking per prompt.
+_OPENAI_CLIENT = None
+
+def _client():
+    """Return the shared OpenAI client, creating it on first use."""
+    global _OPENAI_CLIENT
+    if _OPENAI_CLIENT is None:
+        from openai import OpenAI
+
+        _OPENAI_CLIENT = OpenAI()
+    return _OPENAI_CLIENT
+
+# Persistent disk cache - re-runs skip the Papers-with-Code fetch and the
+# OpenAI calls entirely (saving seconds of latency and API cost), while
+# still producing identical output. Pass --no-cache to force fresh calls.
+CACHE_DIR = Path.home() / ".cache" / "ai-paper-writer"
+CACHE_ENABLED = "--no-cache" not in sys.argv
+TRENDING_CACHE_TTL = 6 * 3600       # Trending list changes slowly; 6 hours
+CHAT_CACHE_TTL = 7 * 24 * 3600      # LLM output for an identical prompt
+
+def _cache_path(key: str) -> Path:
+    """Map an arbitrary cache key to a stable file path under CACHE_DIR."""
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+    return CACHE_DIR / f"{digest}.json"
+
+def _cache_get(key: str, ttl_seconds: int):
+    """
+    Return the cached value for `key`, or None on miss/expiry/corruption.
+
+    Any read failure (missing file, stale entry, malformed JSON) is
+    treated as a cache miss so callers can always fall back to the real
+    network call without extra error handling.
+    """
+    if not CACHE_ENABLED:
+        return None
+    path = _cache_path(key)
+    try:
+        entry = json.loads(path.read_text())
+        if time.time() - entry["timestamp"] > ttl_seconds:
+            return None
+        return entry["value"]
+    except (OSError, ValueError, KeyError, TypeError):
+        # TypeError covers valid JSON that isn't an entry object
+        # (e.g. a bare list), where subscripting by key raises
+        return None
+
+def _cache_put(key: str, value) -> None:
+    """
+    Store a JSON-serializable value under `key` with metadata.
+
+    The timestamp drives TTL expiry in _cache_get; the model name is
+    recorded so cached LLM output can be traced back to the model that
+    produced it. Write failures are silently ignored - caching is an
+    optimization, never a requirement.
+    """
+    if not CACHE_ENABLED:
+        return
+    entry = {"timestamp": time.time(), "model": MODEL_NAME, "value": value}
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _cache_path(key).write_text(json.dumps(entry))
+    except OSError:
+        pass
+
+# Memoized publication-date parses. The same "published" string is read
+# at several points in the pipeline (filter, score, article); parsing it
+# once and caching the result makes every later lookup a dict hit.
+_DATE_CACHE: dict[str, datetime | None] = {}
+
+def _parsed_date(published: str | None) -> datetime | None:
+    """
+    Parse a publication date string, memoizing the result.
+
+    Returns the cached datetime when the same string has been seen
+    before, or None if the string is missing or malformed. The result
+    is always naive (UTC assumed), so callers can subtract it from
+    datetime.now() and skip their own try/except around date parsing
+    entirely.
+    """
+    # Cheap look-before-you-leap guards: anything shorter than a full
+    # YYYY-MM-DD date can't parse, and rejecting it here avoids the
+    # (expensive) exception raise inside fromisoformat
+    if not published or len(published) < 10:
+        return None
+    try:
+        return _DATE_CACHE[published]
+    except KeyError:
+        pass
+    try:
+        parsed = _parse_iso(published.rstrip('Z'))
+        # Dates spelling the offset as +00:00 (rather than Z) parse as
+        # aware datetimes, which can't be subtracted from the naive
+        # datetime.now() - drop the tzinfo so age math never raises
+        if parsed.tzinfo is not None:
+            parsed = parsed.replace(tzinfo=None)
+    except (ValueError, TypeError):
+        parsed = None
+    _DATE_CACHE[published] = parsed
+    return parsed
+
 def _require_env(var: str) -> str:
     """
     Get required environment variable or exit with clear error message.
@@ -67,25 +259,42 @@ def is_recent_paper(paper: dict) -> bool:
     - Malformed date → False (better safe than sorry)
     - Future dates → True (some papers are pre-published)
     """
+    # Both supported formats start with the 4-digit year, so slicing it
+    # out and comparing as an int answers the question without building
+    # a datetime. isdigit() screens malformed dates up front, so the
+    # common path never raises - unparseable means not recent.
     published_date = paper.get("published")
-    if not published_date:
-        return False
-    
-    try:
-        # Parse different date formats that might come from the API
-        if "T" in published_date:
-            # ISO format with timezone: 2025-01-15T10:30:00Z
-            paper_date = datetime.fromisoformat(published_date.replace('Z', '+00:00'))
-        else:
-            # Simple date format: 2025-01-15
-            paper_date = datetime.strptime(published_date, "%Y-%m-%d")
-        
-        return paper_date.year >= CURRENT_YEAR
-    except (ValueError, TypeError):
-        # If we can't parse the date, assume it's not recent
+    if not published_date or len(published_date) < 4:
         return False
+    year = published_date[:4]
+    return year.isdigit() and int(year) >= CURRENT_YEAR
 
-def calculate_trending_score(paper: dict) -> dict:
+@dataclass
+class TrendingScore:
+    """
+    Per-paper trending score breakdown.
+
+    A slotted dataclass instead of a dict: it lives for the whole run
+    and is read repeatedly in pick_best/write_article, so fixed slots
+    halve the memory per paper and make access an attribute lookup.
+    __slots__ is spelled out (rather than dataclass(slots=True), which
+    needs Python 3.10) to keep the documented 3.8 floor working.
+    """
+    __slots__ = ('github_stars', 'recency_bonus', 'conference_bonus', 'total_score')
+    github_stars: int       # Community engagement score (stars x 10)
+    recency_bonus: int      # How recent is this paper?
+    conference_bonus: int   # Academic prestige indicator
+    total_score: int        # Final combined score
+
+@dataclass
+class ExternalValidation:
+    """External validation signals for a paper (see validate_external_trending)."""
+    __slots__ = ('arxiv_url', 'has_code', 'validation_score')
+    arxiv_url: str | None   # ArXiv URL if present
+    has_code: bool          # Whether GitHub implementation exists
+    validation_score: int   # Combined external validation score
+
+def calculate_trending_score(paper: dict, now: datetime | None = None) -> TrendingScore:
     """
     Calculate comprehensive trending score using multiple validated metrics.
     
@@ -114,58 +323,117 @@ def calculate_trending_score(paper: dict) -> dict:
     TOTAL SCORE = GitHub Score + Recency Bonus + Conference Bonus
     
     Returns detailed breakdown for transparency and debugging.
+
+    The `now` argument is the reference time for the recency bonus;
+    callers scoring a batch should pass one shared value so all papers
+    are measured against the same instant. Defaults to datetime.now()
+    so the function still works standalone.
     """
-    score_breakdown = {
-        'github_stars': 0,       # Community engagement score
-        'recency_bonus': 0,      # How recent is this paper?
-        'conference_bonus': 0,   # Academic prestige indicator
-        'total_score': 0         # Final combined score
-    }
-    
+    now = now or datetime.now()
+
     # COMPONENT 1: GitHub Stars (Community Engagement)
-    # Stars indicate real-world adoption and practical value
-    github_stars = paper.get("github_stars", 0) or 0
-    score_breakdown['github_stars'] = github_stars * 10
-    
+    # Stars indicate real-world adoption and practical value. Read the
+    # canonicalized count stashed by the enrichment loop when present,
+    # normalizing (and stashing) it here otherwise.
+    github_stars = paper.get("_stars")
+    if github_stars is None:
+        github_stars = int(paper.get("github_stars") or 0)
+        paper["_stars"] = github_stars
+    github_score = github_stars * 10
+
     # COMPONENT 2: Recency Bonus (Temporal Relevance)
     # Newer papers get higher scores - trending implies recent activity
-    if paper.get("published"):
-        try:
-            if "T" in paper["published"]:
-                paper_date = datetime.fromisoformat(paper["published"].replace('Z', '+00:00'))
-            else:
-                paper_date = datetime.strptime(paper["published"], "%Y-%m-%d")
-            
-            days_old = (datetime.now() - paper_date).days
-            
-            # Sliding scale: newer = more trending potential
-            if days_old <= 7:
-                score_breakdown['recency_bonus'] = 50    # Breaking news level
-            elif days_old <= 30:
-                score_breakdown['recency_bonus'] = 25    # Very fresh
-            elif days_old <= 90:
-                score_breakdown['recency_bonus'] = 10    # Still current
-            # else: 0 points for older papers
-            
-        except (ValueError, TypeError):
-            # Can't parse date - no recency bonus
-            pass
-    
+    # Reuse the parse cached on the paper dict when an earlier stage
+    # already did the work; otherwise parse (memoized) and stash it so
+    # downstream functions avoid even the cache lookup.
+    recency_bonus = 0
+    paper_date = paper.get("_parsed_published")
+    if paper_date is None:
+        paper_date = _parsed_date(paper.get("published"))
+        paper["_parsed_published"] = paper_date
+    if paper_date is not None:
+        days_old = (now - paper_date).days
+
+        # Sliding scale: newer = more trending potential. The bucket
+        # tables encode the 7/30/90-day tiers (50/25/10/0 points).
+        recency_bonus = _RECENCY_POINTS[
+            bisect.bisect_left(_RECENCY_BUCKETS, days_old)
+        ]
+
     # COMPONENT 3: Conference Bonus (Academic Validation)
-    # Papers from top venues have passed rigorous peer review
-    prestigious_conferences = ['ICLR', 'ICML', 'NeurIPS', 'AAAI', 'IJCAI', 'ACL', 'EMNLP']
+    # Papers from top venues have passed rigorous peer review - one
+    # compiled-regex scan of the venue string decides the bonus.
     conference = paper.get("conference") or ""
-    if conference and any(conf in conference.upper() for conf in prestigious_conferences):
-        score_breakdown['conference_bonus'] = 20
-    
-    # Calculate final combined score
-    score_breakdown['total_score'] = (
-        score_breakdown['github_stars'] + 
-        score_breakdown['recency_bonus'] + 
-        score_breakdown['conference_bonus']
+    conference_bonus = 20 if conference and _CONF_RE.search(conference) else 0
+
+    # Assemble the breakdown with the final combined score
+    return TrendingScore(
+        github_stars=github_score,
+        recency_bonus=recency_bonus,
+        conference_bonus=conference_bonus,
+        total_score=github_score + recency_bonus + conference_bonus,
     )
-    
-    return score_breakdown
+
+def _score_papers(papers: list[dict], now: datetime) -> None:
+    """
+    Attach a 'trending_analysis' breakdown to every paper in the batch.
+
+    With NumPy installed the whole batch is scored in a single
+    structure-of-arrays pass: stars, paper ages and conference flags
+    become columnar arrays and the tier/total arithmetic runs as a few
+    vectorized operations rather than 25 trips through the per-paper
+    scoring function. Without NumPy, falls back to calling
+    calculate_trending_score per paper - results are identical.
+
+    Either way, the raw API fields each paper needs downstream are
+    normalized once onto the dict (_stars as a plain int,
+    _parsed_published as a datetime or None) so later stages never
+    repeat the .get()-and-coerce dance.
+    """
+    for paper in papers:
+        if "_stars" not in paper:
+            paper["_stars"] = int(paper.get("github_stars") or 0)
+        if "_parsed_published" not in paper:
+            paper["_parsed_published"] = _parsed_date(paper.get("published"))
+
+    if np is None:
+        for paper in papers:
+            paper['trending_analysis'] = calculate_trending_score(paper, now=now)
+        return
+
+    # Build the columns once from the normalized fields; everything
+    # after this point is array math.
+    far_past = 1 << 30  # sentinel "age" for unparseable dates: no bonus
+    ages = [
+        (now - paper["_parsed_published"]).days
+        if paper["_parsed_published"] is not None else far_past
+        for paper in papers
+    ]
+
+    n = len(papers)
+    stars = np.fromiter(
+        (paper["_stars"] for paper in papers), dtype=np.int64, count=n,
+    ) * 10
+    days_old = np.fromiter(ages, dtype=np.int64, count=n)
+    recency = np.asarray(_RECENCY_POINTS)[
+        np.searchsorted(_RECENCY_BUCKETS, days_old, side='left')
+    ]
+    has_conf = np.fromiter(
+        (bool(conf and _CONF_RE.search(conf))
+         for conf in ((paper.get("conference") or "") for paper in papers)),
+        dtype=bool, count=n,
+    )
+    conference = np.where(has_conf, 20, 0)
+    total = stars + recency + conference
+
+    # Write the familiar breakdown records back onto the papers
+    for i, paper in enumerate(papers):
+        paper['trending_analysis'] = TrendingScore(
+            github_stars=int(stars[i]),
+            recency_bonus=int(recency[i]),
+            conference_bonus=int(conference[i]),
+            total_score=int(total[i]),
+        )
 
 def fetch_trending() -> list[dict]:
     """
@@ -181,9 +449,21 @@ def fetch_trending() -> list[dict]:
     (This handles edge cases early in the year when few new papers exist)
     """
     print("🔍  Fetching papers from Papers-with-Code...")
-    response = requests.get(TRENDING_ENDPOINT, headers=HEADERS, timeout=30)
-    response.raise_for_status()
-    all_papers = response.json()["results"]
+    cache_key = f"{TRENDING_ENDPOINT}|{date.today().isoformat()}"
+    all_papers = _cache_get(cache_key, TRENDING_CACHE_TTL)
+    if all_papers is None:
+        response = _session().get(TRENDING_ENDPOINT, timeout=30)
+        response.raise_for_status()
+        all_papers = _json_loads(response.content)["results"]
+        # Keep only the fields the pipeline uses (also shrinks the
+        # cached copy on disk)
+        all_papers = [
+            {field: paper.get(field) for field in USED_FIELDS}
+            for paper in all_papers
+        ]
+        _cache_put(cache_key, all_papers)
+    else:
+        print("💾  Using cached trending list (pass --no-cache to refetch)")
     
     print(f"📄  Found {len(all_papers)} trending papers total")
     
@@ -196,13 +476,14 @@ def fetch_trending() -> list[dict]:
         print(f"⚠️   No papers found from {CURRENT_YEAR}+, falling back to all trending papers")
         recent_papers = all_papers[:10]  # Take top 10 if no recent ones
     
-    # Enrich each paper with our comprehensive trending analysis
-    for paper in recent_papers:
-        paper['trending_analysis'] = calculate_trending_score(paper)
+    # Enrich each paper with our comprehensive trending analysis.
+    # One shared reference time keeps recency bonuses consistent across
+    # the whole batch (and avoids a clock read per paper).
+    _score_papers(recent_papers, now=datetime.now())
     
     return recent_papers
 
-def validate_external_trending(paper: dict) -> dict:
+def validate_external_trending(paper: dict) -> ExternalValidation:
     """
     Validate trending status using external signals beyond the base API.
     
@@ -228,32 +509,38 @@ def validate_external_trending(paper: dict) -> dict:
     is trending for legitimate academic/practical reasons, not just
     algorithmic quirks in the trending detection.
     """
-    validation = {
-        'arxiv_url': None,           # ArXiv URL if present
-        'has_code': False,           # Whether GitHub implementation exists
-        'validation_score': 0        # Combined external validation score
-    }
-    
+    arxiv_url = None
+    has_code = False
+    validation_score = 0
+
     # VALIDATION 1: ArXiv Presence (Academic Credibility)
     # ArXiv is the standard preprint server for ML research
-    arxiv_url = paper.get("url_abs", "")
-    if "arxiv.org" in arxiv_url:
-        validation['arxiv_url'] = arxiv_url
-        validation['validation_score'] += 10
-    
+    url_abs = paper.get("url_abs", "")
+    if "arxiv.org" in url_abs:
+        arxiv_url = url_abs
+        validation_score += 10
+
     # VALIDATION 2: Code Availability (Practical Implementation)
     # Papers with GitHub implementations are more likely to be impactful
-    if paper.get("github_stars", 0):
-        validation['has_code'] = True
-        validation['validation_score'] += 15
-    
+    github_stars = paper.get("_stars")
+    if github_stars is None:
+        github_stars = int(paper.get("github_stars") or 0)
+        paper["_stars"] = github_stars
+    if github_stars:
+        has_code = True
+        validation_score += 15
+
     # VALIDATION 3: Conference Status (Peer Review)
     # Any conference affiliation indicates some level of validation
     conference = paper.get("conference") or ""
     if conference and conference.strip():
-        validation['validation_score'] += 5
-    
-    return validation
+        validation_score += 5
+
+    return ExternalValidation(
+        arxiv_url=arxiv_url,
+        has_code=has_code,
+        validation_score=validation_score,
+    )
 
 def pick_best(papers: list[dict]) -> dict:
     """
@@ -261,13 +548,20 @@ def pick_best(papers: list[dict]) -> dict:
     
     SELECTION METHODOLOGY:
     =====================
-    
-    1. Calculate external validation score for each paper
-    2. Combine trending score + validation score
-    3. Sort by total score (highest first)
+
+    1. Shortlist the top candidates by trending score alone
+    2. Calculate external validation score for the shortlist only
+    3. Combine trending score + validation score
     4. Display top 3 candidates with detailed breakdowns
     5. Return highest-scoring paper
-    
+
+    The shortlist is the top 5 by trending score, widened with any
+    paper within _VALIDATION_MAX points of the 5th-ranked candidate.
+    Validation can add at most _VALIDATION_MAX points, so papers below
+    that line cannot reach even the 5th candidate's combined score -
+    the two-stage retrieve-then-rerank keeps the selection identical to
+    validating everything while skipping the tail of the batch.
+
     TRANSPARENCY: Shows exact scoring rationale for top candidates
     so users can understand why each paper was ranked as it was.
     
@@ -281,36 +575,62 @@ def pick_best(papers: list[dict]) -> dict:
     
     print("\n📊  Analyzing trending metrics...")
     
-    # Add external validation to each paper
-    for paper in papers:
+    # STAGE 1: shortlist by trending score alone - validating the whole
+    # batch is wasted work when only the leaders can win
+    if len(papers) <= 5:
+        shortlist = list(papers)
+    else:
+        # Take the top 5, widened with every paper whose trending score
+        # is within the validation bound of the 5th-ranked candidate.
+        # Anything below that cutoff cannot reach the 5th candidate's
+        # combined score even with maximum validation, so skipping it
+        # never changes the winner; anything above it gets validated
+        # like the leaders.
+        leaders = heapq.nlargest(
+            5, papers, key=lambda paper: paper['trending_analysis'].total_score
+        )
+        cutoff = leaders[-1]['trending_analysis'].total_score - _VALIDATION_MAX
+        lead_ids = set(map(id, leaders))
+        # Rebuild the shortlist in original API order: the final
+        # nlargest is stable with respect to input order, so combined-
+        # score ties resolve exactly as the old full stable sort did
+        # (first in the API's trending order wins)
+        shortlist = [
+            paper for paper in papers
+            if id(paper) in lead_ids
+            or paper['trending_analysis'].total_score >= cutoff
+        ]
+
+    # STAGE 2: add external validation and precompute the combined score
+    # for the shortlist only, so ranking below is a plain key lookup
+    for paper in shortlist:
         paper['external_validation'] = validate_external_trending(paper)
-    
-    # Define combined scoring function
-    def combined_score(paper):
-        trending_score = paper.get('trending_analysis', {}).get('total_score', 0)
-        validation_score = paper.get('external_validation', {}).get('validation_score', 0)
-        return trending_score + validation_score
-    
-    # Sort papers by combined score (highest first)
-    sorted_papers = sorted(papers, key=combined_score, reverse=True)
-    
+        paper['_combined'] = (
+            paper['trending_analysis'].total_score
+            + paper['external_validation'].validation_score
+        )
+
+    # Only the top 3 are ever shown (and only the winner used), so an
+    # O(n) heap selection beats a full O(n log n) sort
+    top3 = heapq.nlargest(3, shortlist, key=operator.itemgetter('_combined'))
+
     # Display top 3 candidates with transparent scoring breakdown
     print("\n🏆  Top trending candidates:")
-    for i, paper in enumerate(sorted_papers[:3], 1):
-        trending = paper.get('trending_analysis', {})
-        validation = paper.get('external_validation', {})
-        total = trending.get('total_score', 0) + validation.get('validation_score', 0)
-        
+    for i, paper in enumerate(top3, 1):
+        trending = paper['trending_analysis']
+        validation = paper['external_validation']
+        total = paper['_combined']
+
         print(f"{i}. {paper['title'][:60]}...")
-        print(f"   📈 Trending Score: {trending.get('total_score', 0)} "
-              f"(⭐{trending.get('github_stars', 0)//10} + "
-              f"📅{trending.get('recency_bonus', 0)} + "
-              f"🏛️{trending.get('conference_bonus', 0)})")
-        print(f"   ✅ Validation Score: {validation.get('validation_score', 0)}")
+        print(f"   📈 Trending Score: {trending.total_score} "
+              f"(⭐{trending.github_stars//10} + "
+              f"📅{trending.recency_bonus} + "
+              f"🏛️{trending.conference_bonus})")
+        print(f"   ✅ Validation Score: {validation.validation_score}")
         print(f"   🎯 Total Score: {total}")
         print()
-    
-    return sorted_papers[0]
+
+    return top3[0]
 
 def chat(prompt: str, temperature: float = 0.7, max_tokens: int = 512) -> str:
     """
@@ -318,15 +638,24 @@ def chat(prompt: str, temperature: float = 0.7, max_tokens: int = 512) -> str:
     
     Uses the new OpenAI client format (v1.0+) rather than the deprecated
     ChatCompletion.create() method.
+
+    Responses are cached on disk keyed by (model, temperature, prompt),
+    so re-running with the same selected paper costs nothing.
     """
-    client = OpenAI()
-    response = client.chat.completions.create(
+    cache_key = f"{MODEL_NAME}|{temperature}|{prompt}"
+    cached = _cache_get(cache_key, CHAT_CACHE_TTL)
+    if cached is not None:
+        return cached
+
+    response = _client().chat.completions.create(
         model=MODEL_NAME,
         messages=[{"role": "user", "content": prompt}],
         temperature=temperature,
         max_tokens=max_tokens,
     )
-    return response.choices[0].message.content.strip()
+    content = response.choices[0].message.content.strip()
+    _cache_put(cache_key, content)
+    return content
 
 def write_article(paper: dict) -> str:
     """
@@ -347,34 +676,63 @@ def write_article(paper: dict) -> str:
     - Emphasize competitive advantages (business value)
     """
     paper_url = paper.get("url_abs", "URL not available")
-    
+
     # Extract trending metrics for context
-    trending_info = paper.get('trending_analysis', {})
-    github_stars = trending_info.get('github_stars', 0) // 10
-    
-    # PROMPT 1: Trending-aware summary with business focus
-    summary_prompt = (
-        f"In ≤{WORDS_LIMIT} words, explain this TRENDING ML paper (with {github_stars} GitHub stars) "
-        f"so a non-technical product leader understands it. Avoid equations; use one real-world analogy. "
-        f"Emphasize why it's trending and getting attention.\n\n"
+    github_stars = paper['trending_analysis'].github_stars // 10
+
+    # SINGLE PROMPT: Both sections in one request. The paper metadata is
+    # stated once instead of twice, and one round-trip replaces two -
+    # roughly halving generation latency and trimming input tokens.
+    article_prompt = (
+        f"You are writing two sections about a TRENDING ML paper (with {github_stars} GitHub stars).\n\n"
         f"Title: {paper['title']}\nURL: {paper_url}\n"
-        f"Published: {paper.get('published', 'Recently')}"
-    )
-    summary = chat(summary_prompt, temperature=0.65)
-
-    # PROMPT 2: Industry-focused hot takes emphasizing competitive advantage
-    hot_prompt = (
-        f"This paper has {github_stars} GitHub stars and is trending. "
-        "Give three short, bold, evidence-based bullet points on why this trending research "
-        "matters for industry within the next 12 months. Focus on competitive advantages "
-        "and market opportunities. Start each line with •"
+        f"Published: {paper.get('published', 'Recently')}\n\n"
+        f"SECTION 1: In ≤{WORDS_LIMIT} words, explain the paper so a non-technical product "
+        f"leader understands it. Avoid equations; use one real-world analogy. "
+        f"Emphasize why it's trending and getting attention.\n\n"
+        f"SECTION 2: Give three short, bold, evidence-based bullet points on why this "
+        f"trending research matters for industry within the next 12 months. Focus on "
+        f"competitive advantages and market opportunities. Start each line with •\n\n"
+        f"Format your answer EXACTLY as:\n"
+        f"<SUMMARY>\n...section 1...\n</SUMMARY>\n<HOTTAKES>\n...section 2...\n</HOTTAKES>"
     )
-    hot_take = chat(hot_prompt, temperature=0.8)
+    response = chat(article_prompt, temperature=0.7, max_tokens=768)
+
+    # Parse the two tagged sections out of the single response
+    summary_match = re.search(r"<SUMMARY>(.*?)</SUMMARY>", response, re.DOTALL)
+    hot_match = re.search(r"<HOTTAKES>(.*?)</HOTTAKES>", response, re.DOTALL)
+    if summary_match and hot_match:
+        summary = summary_match.group(1).strip()
+        hot_take = hot_match.group(1).strip()
+    else:
+        # Model ignored the format - fall back to the two classic
+        # prompts, fired concurrently so the retry still costs only one
+        # round-trip of wall-clock time. The shared client means both
+        # threads reuse the same connection pool.
+        summary_prompt = (
+            f"In ≤{WORDS_LIMIT} words, explain this TRENDING ML paper (with {github_stars} GitHub stars) "
+            f"so a non-technical product leader understands it. Avoid equations; use one real-world analogy. "
+            f"Emphasize why it's trending and getting attention.\n\n"
+            f"Title: {paper['title']}\nURL: {paper_url}\n"
+            f"Published: {paper.get('published', 'Recently')}"
+        )
+        hot_prompt = (
+            f"This paper has {github_stars} GitHub stars and is trending. "
+            "Give three short, bold, evidence-based bullet points on why this trending research "
+            "matters for industry within the next 12 months. Focus on competitive advantages "
+            "and market opportunities. Start each line with •"
+        )
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            summary_future = pool.submit(chat, summary_prompt, temperature=0.65)
+            hot_future = pool.submit(chat, hot_prompt, temperature=0.8)
+            summary = summary_future.result()
+            hot_take = hot_future.result()
 
     # Get trending metrics for transparent display
-    trending = paper.get('trending_analysis', {})
-    validation = paper.get('external_validation', {})
-    total_score = trending.get('total_score', 0) + validation.get('validation_score', 0)
+    total_score = (
+        paper['trending_analysis'].total_score
+        + paper['external_validation'].validation_score
+    )
     
     # Format final LinkedIn post with trending indicators and transparency
     post = textwrap.dedent(f"""\
@@ -412,6 +770,7 @@ def main() -> None:
     like no recent papers, API failures, or missing data fields.
     """
     # Load environment variables from .env file
+    from dotenv import load_dotenv
     load_dotenv()
     api_key = _require_env("OPENAI_API_KEY")
 
@@ -432,9 +791,10 @@ def main() -> None:
         return
     
     # Display selection summary with score breakdown
-    trending_score = best.get('trending_analysis', {}).get('total_score', 0)
-    validation_score = best.get('external_validation', {}).get('validation_score', 0)
-    total_score = trending_score + validation_score
+    total_score = (
+        best['trending_analysis'].total_score
+        + best['external_validation'].validation_score
+    )
     
     print(f"🎯  SELECTED: {best['title']}")
     print(f"📈  Total Trending Score: {total_score}")